@@ -1,4 +1,4 @@
-from .estimator import estimate_cost
+from .estimator import estimate_cost, estimate_costs_batch
 from .models import CostBreakdown, TokenUsage
 from .openrouter import ModelCatalogEntry, OpenRouterClient
 from .tokens import count_tokens, estimate_tokens_from_text
@@ -7,6 +7,7 @@ __all__ = [
 	"TokenUsage",
 	"CostBreakdown",
 	"estimate_cost",
+	"estimate_costs_batch",
 	"OpenRouterClient",
 	"ModelCatalogEntry",
 	"count_tokens",
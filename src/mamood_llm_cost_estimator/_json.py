@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from ._optional import optional_import
+
+
+def loads(data: bytes | str) -> Any:
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps_indent(obj: Any) -> str:
+    orjson = optional_import("orjson")
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+import importlib
+from functools import lru_cache
+from types import ModuleType
+
+
+@lru_cache(maxsize=None)
+def optional_import(name: str) -> ModuleType | None:
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
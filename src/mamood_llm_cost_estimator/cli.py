@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
 
+from . import _json
 from .models import TokenUsage
 from .openrouter import OpenRouterClient, OpenRouterError
 from .tokens import count_tokens
@@ -96,19 +96,17 @@ def main() -> int:
         output_tokens=output_tokens,
         cached_input_tokens=args.cached_input_tokens,
     )
-    client = OpenRouterClient(api_key=args.api_key, app_name=args.app_name)
-
-    try:
-        result = client.estimate_model_cost(model=args.model, usage=usage)
-    except OpenRouterError as exc:
-        print(str(exc))
-        return 1
+    with OpenRouterClient(api_key=args.api_key, app_name=args.app_name) as client:
+        try:
+            result = client.estimate_model_cost(model=args.model, usage=usage)
+        except OpenRouterError as exc:
+            print(str(exc))
+            return 1
 
     payload = result.as_dict()
-    payload["input_tokens"] = usage.input_tokens
-    payload["output_tokens"] = usage.output_tokens
+    payload |= usage.as_dict()
     payload["tokenizer"] = args.tokenizer
-    print(json.dumps(payload, indent=2))
+    print(_json.dumps_indent(payload))
     return 0
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from .models import CostBreakdown, TokenUsage
 
 
@@ -11,6 +12,19 @@ def estimate_cost(
     output_price_per_token_usd: float,
     cached_input_price_per_token_usd: float | None = None,
 ) -> CostBreakdown:
+    if (
+        input_price_per_token_usd == 0
+        and output_price_per_token_usd == 0
+        and not cached_input_price_per_token_usd
+    ):
+        return CostBreakdown(
+            model=model,
+            input_cost_usd=0.0,
+            cached_input_cost_usd=0.0,
+            output_cost_usd=0.0,
+            total_cost_usd=0.0,
+        )
+
     cached_price = (
         cached_input_price_per_token_usd
         if cached_input_price_per_token_usd is not None
@@ -22,10 +36,30 @@ def estimate_cost(
     output_cost = usage.output_tokens * output_price_per_token_usd
     total = input_cost + cached_input_cost + output_cost
 
-    return CostBreakdown(
+    return CostBreakdown.build(
         model=model,
         input_cost_usd=input_cost,
         cached_input_cost_usd=cached_input_cost,
         output_cost_usd=output_cost,
         total_cost_usd=total,
     )
+
+
+def estimate_costs_batch(
+    *,
+    model: str,
+    usages: Sequence[TokenUsage],
+    input_price_per_token_usd: float,
+    output_price_per_token_usd: float,
+    cached_input_price_per_token_usd: float | None = None,
+) -> list[CostBreakdown]:
+    return [
+        estimate_cost(
+            model=model,
+            usage=usage,
+            input_price_per_token_usd=input_price_per_token_usd,
+            output_price_per_token_usd=output_price_per_token_usd,
+            cached_input_price_per_token_usd=cached_input_price_per_token_usd,
+        )
+        for usage in usages
+    ]
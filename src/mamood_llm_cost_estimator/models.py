@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass(slots=True)
@@ -11,10 +12,18 @@ class TokenUsage:
 
     @property
     def non_cached_input_tokens(self) -> int:
-        return max(0, self.input_tokens - self.cached_input_tokens)
+        remaining = self.input_tokens - self.cached_input_tokens
+        return remaining if remaining > 0 else 0
 
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cached_input_tokens": self.cached_input_tokens,
+        }
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class CostBreakdown:
     model: str
     input_cost_usd: float
@@ -23,12 +32,32 @@ class CostBreakdown:
     total_cost_usd: float
     currency: str = "USD"
 
-    def as_dict(self) -> dict[str, str | float]:
+    @classmethod
+    def build(
+        cls,
+        *,
+        model: str,
+        input_cost_usd: float,
+        cached_input_cost_usd: float,
+        output_cost_usd: float,
+        total_cost_usd: float,
+        currency: str = "USD",
+    ) -> CostBreakdown:
+        return cls(
+            model=model,
+            input_cost_usd=round(input_cost_usd, 10),
+            cached_input_cost_usd=round(cached_input_cost_usd, 10),
+            output_cost_usd=round(output_cost_usd, 10),
+            total_cost_usd=round(total_cost_usd, 10),
+            currency=currency,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
         return {
             "model": self.model,
-            "input_cost_usd": round(self.input_cost_usd, 10),
-            "cached_input_cost_usd": round(self.cached_input_cost_usd, 10),
-            "output_cost_usd": round(self.output_cost_usd, 10),
-            "total_cost_usd": round(self.total_cost_usd, 10),
+            "input_cost_usd": self.input_cost_usd,
+            "cached_input_cost_usd": self.cached_input_cost_usd,
+            "output_cost_usd": self.output_cost_usd,
+            "total_cost_usd": self.total_cost_usd,
             "currency": self.currency,
         }
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-import json
+import hashlib
+import os
 import time
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
-from .estimator import estimate_cost
+from . import _json
+from ._optional import optional_import
+from .estimator import estimate_cost, estimate_costs_batch
 from .models import CostBreakdown, TokenUsage
 
 
@@ -15,7 +21,37 @@ class OpenRouterError(RuntimeError):
     pass
 
 
-@dataclass(slots=True)
+_PROVIDER_PREFIX: dict[str, str] = {
+    "openai": "OpenAI",
+    "google": "Google",
+    "anthropic": "Anthropic",
+    "meta-llama": "Meta",
+    "meta": "Meta",
+    "cohere": "Cohere",
+    "deepseek": "DeepSeek",
+    "qwen": "Alibaba",
+    "microsoft": "Microsoft",
+    "perplexity": "Perplexity",
+}
+
+
+def _disk_cache_file(
+    base_url: str, cache_dir: str | os.PathLike[str] | None
+) -> Path | None:
+    try:
+        if cache_dir is not None:
+            directory = Path(cache_dir).expanduser()
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+            directory = Path(base).expanduser() / "mamood-llm-cost-estimator"
+    except (RuntimeError, OSError):
+        return None
+
+    cache_key = hashlib.sha1(base_url.encode("utf-8")).hexdigest()[:12]
+    return directory / f"models-{cache_key}.json"
+
+
+@dataclass(slots=True, frozen=True)
 class ModelPricing:
     model: str
     input_price_per_token_usd: float
@@ -46,6 +82,7 @@ class ModelCatalogEntry:
 class CachedModelCatalog:
     timestamp: float
     models: list[ModelCatalogEntry]
+    pricing_by_id: dict[str, ModelPricing]
 
 
 class OpenRouterClient:
@@ -56,12 +93,31 @@ class OpenRouterClient:
         base_url: str = "https://openrouter.ai/api/v1",
         app_name: str | None = None,
         cache_ttl_seconds: int = 3600,
+        cache_dir: str | os.PathLike[str] | None = None,
+        use_disk_cache: bool = True,
+        disk_cache_max_age_seconds: int = 7 * 24 * 3600,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
         self._app_name = app_name
         self._cache_ttl_seconds = max(0, cache_ttl_seconds)
         self._cache: CachedModelCatalog | None = None
+        self._cache_file = (
+            _disk_cache_file(self._base_url, cache_dir) if use_disk_cache else None
+        )
+        self._disk_cache_max_age_seconds = max(0, disk_cache_max_age_seconds)
+        self._session: Any = None
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> OpenRouterClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     @staticmethod
     def _parse_price(value: str | float | int | None) -> float:
@@ -77,6 +133,22 @@ class OpenRouterClient:
             return 0.0
         return parsed
 
+    @classmethod
+    def _bulk_price_parser(cls) -> Callable[[Any], float]:
+        parsed_prices: dict[Any, float] = {}
+        parse_price = cls._parse_price
+
+        def parse(value: Any) -> float:
+            try:
+                return parsed_prices[value]
+            except KeyError:
+                parsed = parsed_prices[value] = parse_price(value)
+                return parsed
+            except TypeError:
+                return parse_price(value)
+
+        return parse
+
     @staticmethod
     def _parse_int(value: Any) -> int:
         try:
@@ -87,120 +159,213 @@ class OpenRouterClient:
 
     @staticmethod
     def _guess_provider(model_id: str, name: str) -> str:
-        lower_id = model_id.lower()
-
-        if lower_id.startswith("openai/"):
-            return "OpenAI"
-        if lower_id.startswith("google/"):
-            return "Google"
-        if lower_id.startswith("anthropic/"):
-            return "Anthropic"
-        if lower_id.startswith("mistral"):
+        head, sep, _ = model_id.partition("/")
+        head = head.lower()
+
+        if head.startswith("mistral"):
             return "Mistral"
-        if lower_id.startswith("meta-llama/") or lower_id.startswith("meta/"):
-            return "Meta"
-        if lower_id.startswith("cohere/"):
-            return "Cohere"
-        if lower_id.startswith("deepseek/"):
-            return "DeepSeek"
-        if lower_id.startswith("qwen/"):
-            return "Alibaba"
-        if lower_id.startswith("microsoft/"):
-            return "Microsoft"
-        if lower_id.startswith("perplexity/"):
-            return "Perplexity"
-
-        parts = model_id.split("/", maxsplit=1)
-        if len(parts) > 1 and parts[0]:
-            provider = parts[0].strip().lower()
-            return provider[0].upper() + provider[1:]
-
-        if name:
-            return "Other"
+
+        if sep:
+            provider = _PROVIDER_PREFIX.get(head)
+            if provider is not None:
+                return provider
+
+            head = head.strip()
+            if head:
+                return head[0].upper() + head[1:]
+
         return "Other"
 
     def list_models(self, *, force_refresh: bool = False) -> list[ModelCatalogEntry]:
+        return self._get_catalog(force_refresh=force_refresh).models
+
+    async def list_models_async(
+        self, *, force_refresh: bool = False
+    ) -> list[ModelCatalogEntry]:
+        catalog = await self._get_catalog_async(force_refresh=force_refresh)
+        return catalog.models
+
+    def _get_catalog(self, *, force_refresh: bool = False) -> CachedModelCatalog:
+        now = time.time()
+        if self._cache is None and self._cache_file is not None:
+            self._cache = self._load_disk_cache()
+        cache = self._fresh_cache(now, force_refresh=force_refresh)
+        if cache is not None:
+            return cache
+
+        try:
+            models_payload = self._get_json(f"{self._base_url}/models")
+            catalog = self._update_cache(models_payload, timestamp=now)
+        except OpenRouterError as exc:
+            return self._stale_cache_or_raise(exc)
+
+        if self._cache_file is not None:
+            self._store_disk_cache(models_payload)
+        return catalog
+
+    async def _get_catalog_async(
+        self, *, force_refresh: bool = False
+    ) -> CachedModelCatalog:
+        import asyncio
+
         now = time.time()
+        if self._cache is None and self._cache_file is not None:
+            self._cache = await asyncio.to_thread(self._load_disk_cache)
+        cache = self._fresh_cache(now, force_refresh=force_refresh)
+        if cache is not None:
+            return cache
+
+        try:
+            models_payload = await self._get_json_async(f"{self._base_url}/models")
+            catalog = self._update_cache(models_payload, timestamp=now)
+        except OpenRouterError as exc:
+            return self._stale_cache_or_raise(exc)
+
+        if self._cache_file is not None:
+            await asyncio.to_thread(self._store_disk_cache, models_payload)
+        return catalog
+
+    def _fresh_cache(
+        self, now: float, *, force_refresh: bool
+    ) -> CachedModelCatalog | None:
         cache = self._cache
-        is_fresh = (
-            cache is not None and (now - cache.timestamp) < self._cache_ttl_seconds
+        if (
+            cache is not None
+            and not force_refresh
+            and (now - cache.timestamp) < self._cache_ttl_seconds
+        ):
+            return cache
+        return None
+
+    def _stale_cache_or_raise(self, exc: OpenRouterError) -> CachedModelCatalog:
+        if self._cache is not None:
+            return self._cache
+        raise exc
+
+    def _update_cache(
+        self, models_payload: dict[str, Any], *, timestamp: float
+    ) -> CachedModelCatalog:
+        catalog = self._build_catalog(models_payload, timestamp=timestamp)
+        self._cache = catalog
+        return catalog
+
+    def _build_catalog(
+        self, models_payload: dict[str, Any], *, timestamp: float
+    ) -> CachedModelCatalog:
+        raw_data = models_payload.get("data", [])
+        if not isinstance(raw_data, list):
+            raise OpenRouterError("Invalid API response: 'data' is not an array.")
+
+        models: list[ModelCatalogEntry] = []
+        pricing_by_id: dict[str, ModelPricing] = {}
+        for entry in self._iter_catalog(raw_data):
+            models.append(entry)
+            if entry.id in pricing_by_id:
+                continue
+            pricing_by_id[entry.id] = ModelPricing(
+                model=entry.id,
+                input_price_per_token_usd=entry.input_price_per_token_usd,
+                output_price_per_token_usd=entry.output_price_per_token_usd,
+                cached_input_price_per_token_usd=entry.cached_input_price_per_token_usd,
+            )
+
+        return CachedModelCatalog(
+            timestamp=timestamp,
+            models=models,
+            pricing_by_id=pricing_by_id,
         )
 
-        if cache is not None and is_fresh and not force_refresh:
-            return cache.models
+    def _iter_catalog(self, raw_data: list[Any]) -> Iterator[ModelCatalogEntry]:
+        parse_price = self._bulk_price_parser()
+        parse_int = self._parse_int
+        guess_provider = self._guess_provider
+        entry_type = ModelCatalogEntry
+
+        for item in raw_data:
+            if not isinstance(item, dict):
+                continue
+
+            item_get = item.get
+            model_id = item_get("id")
+            if not isinstance(model_id, str) or not model_id:
+                continue
+
+            model_name = item_get("name")
+            if not isinstance(model_name, str):
+                model_name = model_id
+
+            pricing = item_get("pricing")
+            if not isinstance(pricing, dict):
+                pricing = {}
+            pricing_get = pricing.get
+
+            cached_prompt = pricing_get("cached_prompt")
+            yield entry_type(
+                id=model_id,
+                name=model_name,
+                provider=guess_provider(model_id, model_name),
+                context_window=parse_int(item_get("context_length")),
+                input_price_per_token_usd=parse_price(pricing_get("prompt")),
+                output_price_per_token_usd=parse_price(pricing_get("completion")),
+                cached_input_price_per_token_usd=parse_price(cached_prompt)
+                if cached_prompt is not None
+                else None,
+            )
+
+    def _load_disk_cache(self) -> CachedModelCatalog | None:
+        cache_file = self._cache_file
+        if cache_file is None:
+            return None
 
         try:
-            models_payload = self._get_json(f"{self._base_url}/models")
-            raw_data = models_payload.get("data", [])
-            if not isinstance(raw_data, list):
-                raise OpenRouterError("Invalid API response: 'data' is not an array.")
-
-            models: list[ModelCatalogEntry] = []
-            for item in raw_data:
-                if not isinstance(item, dict):
-                    continue
-
-                model_id = item.get("id")
-                if not isinstance(model_id, str) or not model_id:
-                    continue
-
-                model_name = item.get("name")
-                if not isinstance(model_name, str):
-                    model_name = model_id
-
-                pricing = item.get("pricing")
-                if not isinstance(pricing, dict):
-                    pricing = {}
-
-                models.append(
-                    ModelCatalogEntry(
-                        id=model_id,
-                        name=model_name,
-                        provider=self._guess_provider(model_id, model_name),
-                        context_window=self._parse_int(item.get("context_length")),
-                        input_price_per_token_usd=self._parse_price(pricing.get("prompt")),
-                        output_price_per_token_usd=self._parse_price(
-                            pricing.get("completion")
-                        ),
-                        cached_input_price_per_token_usd=self._parse_price(
-                            pricing.get("cached_prompt")
-                        )
-                        if pricing.get("cached_prompt") is not None
-                        else None,
-                    )
-                )
+            timestamp = cache_file.stat().st_mtime
+            if time.time() - timestamp >= self._disk_cache_max_age_seconds:
+                return None
+            payload = _json.loads(cache_file.read_bytes())
+        except (OSError, ValueError):
+            return None
 
-            self._cache = CachedModelCatalog(timestamp=now, models=models)
-            return models
+        if not isinstance(payload, dict):
+            return None
+
+        try:
+            return self._build_catalog(payload, timestamp=timestamp)
         except OpenRouterError:
-            if cache is not None:
-                return cache.models
-            raise
+            return None
 
-    def fetch_models(self, *, force_refresh: bool = False) -> list[ModelPricing]:
-        return [
-            ModelPricing(
-                model=item.id,
-                input_price_per_token_usd=item.input_price_per_token_usd,
-                output_price_per_token_usd=item.output_price_per_token_usd,
-                cached_input_price_per_token_usd=item.cached_input_price_per_token_usd,
+    def _store_disk_cache(self, models_payload: dict[str, Any]) -> None:
+        import tempfile
+
+        cache_file = self._cache_file
+        if cache_file is None:
+            return
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_file.parent, prefix=f".{cache_file.name}.", suffix=".tmp"
             )
-            for item in self.list_models(force_refresh=force_refresh)
-        ]
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(_json.dumps(models_payload))
+                os.replace(tmp_path, cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def fetch_models(self, *, force_refresh: bool = False) -> list[ModelPricing]:
+        catalog = self._get_catalog(force_refresh=force_refresh)
+        return list(catalog.pricing_by_id.values())
 
     def get_model_pricing(self, model: str) -> ModelPricing:
-        for item in self.list_models():
-            if item.id == model:
-                return ModelPricing(
-                    model=item.id,
-                    input_price_per_token_usd=item.input_price_per_token_usd,
-                    output_price_per_token_usd=item.output_price_per_token_usd,
-                    cached_input_price_per_token_usd=item.cached_input_price_per_token_usd,
-                )
-
-        raise OpenRouterError(
-            f"Model '{model}' was not found in OpenRouter model catalog."
-        )
+        pricing = self._get_catalog().pricing_by_id.get(model)
+        if pricing is None:
+            raise OpenRouterError(
+                f"Model '{model}' was not found in OpenRouter model catalog."
+            )
+        return pricing
 
     def estimate_model_cost(self, *, model: str, usage: TokenUsage) -> CostBreakdown:
         pricing = self.get_model_pricing(model)
@@ -212,7 +377,19 @@ class OpenRouterClient:
             cached_input_price_per_token_usd=pricing.cached_input_price_per_token_usd,
         )
 
-    def _get_json(self, url: str) -> dict[str, Any]:
+    def estimate_model_costs(
+        self, *, model: str, usages: Sequence[TokenUsage]
+    ) -> list[CostBreakdown]:
+        pricing = self.get_model_pricing(model)
+        return estimate_costs_batch(
+            model=model,
+            usages=usages,
+            input_price_per_token_usd=pricing.input_price_per_token_usd,
+            output_price_per_token_usd=pricing.output_price_per_token_usd,
+            cached_input_price_per_token_usd=pricing.cached_input_price_per_token_usd,
+        )
+
+    def _build_headers(self) -> dict[str, str]:
         headers = {
             "Accept": "application/json",
             "User-Agent": "mamood-llm-cost-estimator/0.1.0",
@@ -221,12 +398,80 @@ class OpenRouterClient:
             headers["Authorization"] = f"Bearer {self._api_key}"
         if self._app_name:
             headers["X-Title"] = self._app_name
+        return headers
+
+    def _get_json(self, url: str) -> dict[str, Any]:
+        headers = self._build_headers()
+        requests = optional_import("requests")
+        if requests is not None:
+            if self._session is None:
+                self._session = requests.Session()
+            payload = self._get_json_with_session(requests, self._session, url, headers)
+        else:
+            payload = self._get_json_with_urllib(url, headers)
+
+        if not isinstance(payload, dict):
+            raise OpenRouterError("OpenRouter response had unexpected shape.")
+
+        return payload
+
+    async def _get_json_async(self, url: str) -> dict[str, Any]:
+        import asyncio
+
+        aiohttp = optional_import("aiohttp")
+        if aiohttp is None:
+            return await asyncio.to_thread(self._get_json, url)
+
+        headers = self._build_headers()
+        try:
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=20)
+            ) as session:
+                async with session.get(url, headers=headers) as response:
+                    if response.status >= 400:
+                        raise OpenRouterError(
+                            f"OpenRouter request failed with status {response.status}."
+                        )
+                    body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
+
+        try:
+            payload = _json.loads(body)
+        except ValueError as exc:
+            raise OpenRouterError("OpenRouter response was not valid JSON.") from exc
+
+        if not isinstance(payload, dict):
+            raise OpenRouterError("OpenRouter response had unexpected shape.")
+
+        return payload
 
+    @staticmethod
+    def _get_json_with_session(
+        requests: ModuleType, session: Any, url: str, headers: dict[str, str]
+    ) -> Any:
+        try:
+            response = session.get(url, headers=headers, timeout=20)
+        except requests.RequestException as exc:
+            raise OpenRouterError(f"OpenRouter request failed: {exc}") from exc
+
+        if response.status_code >= 400:
+            raise OpenRouterError(
+                f"OpenRouter request failed with status {response.status_code}."
+            )
+
+        try:
+            return _json.loads(response.content)
+        except ValueError as exc:
+            raise OpenRouterError("OpenRouter response was not valid JSON.") from exc
+
+    @staticmethod
+    def _get_json_with_urllib(url: str, headers: dict[str, str]) -> Any:
         request = Request(url, headers=headers, method="GET")
 
         try:
             with urlopen(request, timeout=20) as response:
-                body = response.read().decode("utf-8")
+                body = response.read()
         except HTTPError as exc:
             raise OpenRouterError(
                 f"OpenRouter request failed with status {exc.code}."
@@ -235,11 +480,6 @@ class OpenRouterClient:
             raise OpenRouterError(f"OpenRouter request failed: {exc.reason}") from exc
 
         try:
-            payload = json.loads(body)
-        except json.JSONDecodeError as exc:
+            return _json.loads(body)
+        except ValueError as exc:
             raise OpenRouterError("OpenRouter response was not valid JSON.") from exc
-
-        if not isinstance(payload, dict):
-            raise OpenRouterError("OpenRouter response had unexpected shape.")
-
-        return payload
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from typing import Any
 
+from ._optional import optional_import
 
-def estimate_tokens_from_text(text: str, *, chars_per_token: float = 4.0) -> int:
-    stripped = text.strip()
+
+def estimate_tokens_from_text(
+    text: str, *, chars_per_token: float = 4.0, _prestripped: bool = False
+) -> int:
+    stripped = text if _prestripped else text.strip()
     if not stripped:
         return 0
 
     effective_chars_per_token = chars_per_token if chars_per_token > 0 else 4.0
+    if effective_chars_per_token.is_integer():
+        cpt = int(effective_chars_per_token)
+        return max(1, (len(stripped) + cpt - 1) // cpt)
     return max(1, math.ceil(len(stripped) / effective_chars_per_token))
 
 
+@lru_cache(maxsize=128)
 def _normalize_openrouter_model_id(model: str | None) -> str | None:
     if model is None:
         return None
@@ -28,6 +38,24 @@ def _normalize_openrouter_model_id(model: str | None) -> str | None:
     return normalized
 
 
+@lru_cache(maxsize=64)
+def _encoding_for_model(model_name: str) -> Any:
+    tiktoken: Any = optional_import("tiktoken")
+    try:
+        return tiktoken.encoding_for_model(model_name)
+    except KeyError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _get_fallback_encoding() -> Any:
+    tiktoken: Any = optional_import("tiktoken")
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 def count_tokens(
     text: str,
     *,
@@ -42,23 +70,19 @@ def count_tokens(
     if not stripped:
         return 0
 
-    try:
-        import tiktoken  # type: ignore[import-not-found]
-    except Exception:
-        return estimate_tokens_from_text(stripped, chars_per_token=chars_per_token)
+    if optional_import("tiktoken") is None:
+        return estimate_tokens_from_text(
+            stripped, chars_per_token=chars_per_token, _prestripped=True
+        )
 
     model_name = _normalize_openrouter_model_id(model)
 
     if model_name:
         try:
-            encoding = tiktoken.encoding_for_model(model_name)
-            return len(encoding.encode(stripped))
+            encoding = _encoding_for_model(model_name)
+            if encoding is not None:
+                return len(encoding.encode(stripped))
         except Exception:
             pass
 
-    try:
-        fallback_encoding = tiktoken.get_encoding("o200k_base")
-    except Exception:
-        fallback_encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(fallback_encoding.encode(stripped))
+    return len(_get_fallback_encoding().encode(stripped))
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+CATALOG_PAYLOAD: dict[str, Any] = {
+    "data": [
+        {
+            "id": "openai/gpt-4o-mini",
+            "name": "GPT-4o mini",
+            "context_length": 128000,
+            "pricing": {
+                "prompt": "0.00000015",
+                "completion": "0.0000006",
+                "cached_prompt": "0.000000075",
+            },
+        },
+        {
+            "id": "meta-llama/llama-3-8b-instruct:free",
+            "name": "Llama 3 8B (free)",
+            "context_length": 8192,
+            "pricing": {"prompt": "0", "completion": "0"},
+        },
+    ]
+}
+
+
+class CatalogServer:
+    def __init__(self) -> None:
+        self.payload: dict[str, Any] = CATALOG_PAYLOAD
+        self.status = 200
+        self.paths: list[str] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.base_url = f"http://127.0.0.1:{self._server.server_port}/api/v1"
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.paths.append(self.path)
+                body = json.dumps(server.payload).encode("utf-8")
+                self.send_response(server.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def start(self) -> None:
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def catalog_server() -> Iterator[CatalogServer]:
+    server = CatalogServer()
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
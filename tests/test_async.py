@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from mamood_llm_cost_estimator import OpenRouterClient, TokenUsage
+from mamood_llm_cost_estimator import openrouter
+from mamood_llm_cost_estimator._optional import optional_import
+from mamood_llm_cost_estimator.openrouter import OpenRouterError
+
+
+@pytest.fixture(params=["aiohttp", "thread"])
+def async_backend(request, monkeypatch):
+    if request.param == "aiohttp":
+        pytest.importorskip("aiohttp")
+    else:
+        monkeypatch.setattr(
+            openrouter,
+            "optional_import",
+            lambda name: None if name == "aiohttp" else optional_import(name),
+        )
+    return request.param
+
+
+def test_async_fetch_warms_cache_for_sync_calls(async_backend, catalog_server, tmp_path):
+    with OpenRouterClient(
+        base_url=catalog_server.base_url, app_name="tests", cache_dir=tmp_path
+    ) as client:
+        models = asyncio.run(client.list_models_async())
+        cost = client.estimate_model_cost(
+            model="openai/gpt-4o-mini",
+            usage=TokenUsage(input_tokens=1500, output_tokens=700),
+        )
+
+    assert [model.id for model in models] == [
+        "openai/gpt-4o-mini",
+        "meta-llama/llama-3-8b-instruct:free",
+    ]
+    assert cost.total_cost_usd == pytest.approx(0.000645)
+    assert catalog_server.paths == ["/api/v1/models"]
+
+
+def test_async_fetch_uses_disk_cache(async_backend, catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        client.list_models()
+
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        assert len(asyncio.run(client.list_models_async())) == 2
+
+    assert len(catalog_server.paths) == 1
+
+
+def test_async_disk_cache_io_runs_off_the_event_loop(
+    async_backend, catalog_server, tmp_path, monkeypatch
+):
+    threads: dict[str, int] = {}
+    for name in ("_load_disk_cache", "_store_disk_cache"):
+        original = getattr(OpenRouterClient, name)
+
+        def record(self, *args, _name=name, _original=original):
+            threads[_name] = threading.get_ident()
+            return _original(self, *args)
+
+        monkeypatch.setattr(OpenRouterClient, name, record)
+
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        asyncio.run(client.list_models_async())
+
+    assert set(threads) == {"_load_disk_cache", "_store_disk_cache"}
+    assert threading.get_ident() not in threads.values()
+
+
+def test_async_fetch_error_without_cache(async_backend, catalog_server):
+    catalog_server.status = 500
+    with OpenRouterClient(base_url=catalog_server.base_url, use_disk_cache=False) as client:
+        with pytest.raises(OpenRouterError, match="status 500"):
+            asyncio.run(client.list_models_async())
+
+
+def test_async_refresh_falls_back_to_cached_catalog(async_backend, catalog_server):
+    with OpenRouterClient(base_url=catalog_server.base_url, use_disk_cache=False) as client:
+        models = asyncio.run(client.list_models_async())
+        catalog_server.status = 500
+        assert asyncio.run(client.list_models_async(force_refresh=True)) == models
+
+    assert len(catalog_server.paths) == 2
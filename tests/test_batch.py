@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from mamood_llm_cost_estimator import (
+    OpenRouterClient,
+    TokenUsage,
+    estimate_cost,
+    estimate_costs_batch,
+)
+
+PRICES = {
+    "input_price_per_token_usd": 1.5e-07,
+    "output_price_per_token_usd": 6e-07,
+}
+
+
+def _random_usages(count: int) -> list[TokenUsage]:
+    rng = random.Random(1234)
+    return [
+        TokenUsage(
+            input_tokens=rng.randint(0, 10**6),
+            output_tokens=rng.randint(0, 10**5),
+            cached_input_tokens=rng.randint(0, 10**6),
+        )
+        for _ in range(count)
+    ]
+
+
+def _scalar(usages: list[TokenUsage], **prices: float | None) -> list:
+    return [estimate_cost(model="m", usage=usage, **prices) for usage in usages]
+
+
+@pytest.mark.parametrize("cached_price", [None, 7.5e-08])
+def test_batch_matches_scalar(cached_price):
+    usages = _random_usages(5000)
+    prices = {**PRICES, "cached_input_price_per_token_usd": cached_price}
+
+    assert estimate_costs_batch(model="m", usages=usages, **prices) == _scalar(
+        usages, **prices
+    )
+
+
+def test_batch_of_nothing_is_empty():
+    assert estimate_costs_batch(model="m", usages=[], **PRICES) == []
+
+
+def test_client_batch_fetches_pricing_once(catalog_server, tmp_path):
+    usages = _random_usages(50)
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        batch = client.estimate_model_costs(model="openai/gpt-4o-mini", usages=usages)
+        single = [
+            client.estimate_model_cost(model="openai/gpt-4o-mini", usage=usage)
+            for usage in usages
+        ]
+
+    assert batch == single
+    assert catalog_server.paths == ["/api/v1/models"]
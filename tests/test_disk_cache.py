@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import os
+import socket
+import time
+from pathlib import Path
+
+import pytest
+
+from mamood_llm_cost_estimator import OpenRouterClient
+from mamood_llm_cost_estimator.openrouter import OpenRouterError
+
+
+def _cache_files(cache_dir: Path) -> list[Path]:
+    return sorted(path for path in cache_dir.iterdir() if path.is_file())
+
+
+def _age(path: Path, seconds: float) -> None:
+    stamp = time.time() - seconds
+    os.utime(path, (stamp, stamp))
+
+
+def _unused_base_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/api/v1"
+
+
+def test_catalog_round_trips_through_disk(catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        models = client.list_models()
+
+    cache_files = _cache_files(tmp_path)
+    assert len(cache_files) == 1
+    assert cache_files[0].name.startswith("models-")
+
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        assert client.list_models() == models
+        assert client.get_model_pricing("openai/gpt-4o-mini").input_price_per_token_usd == (
+            1.5e-07
+        )
+
+    assert catalog_server.paths == ["/api/v1/models"]
+
+
+def test_expired_disk_cache_is_refreshed(catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        client.list_models()
+    _age(next(tmp_path.glob("models-*.json")), 120)
+
+    with OpenRouterClient(
+        base_url=catalog_server.base_url, cache_dir=tmp_path, cache_ttl_seconds=60
+    ) as client:
+        client.list_models()
+
+    assert len(catalog_server.paths) == 2
+
+
+def test_disk_cache_is_keyed_by_base_url(catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        client.list_models()
+
+    with OpenRouterClient(base_url=_unused_base_url(), cache_dir=tmp_path) as client:
+        with pytest.raises(OpenRouterError):
+            client.list_models()
+
+    assert len(list(tmp_path.glob("models-*.json"))) == 1
+
+
+def test_failed_write_leaves_no_partial_file(catalog_server, tmp_path, monkeypatch):
+    def fail_replace(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        assert len(client.list_models()) == 2
+
+    assert _cache_files(tmp_path) == []
+
+
+def test_stale_disk_cache_is_used_when_refresh_fails(catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        models = client.list_models()
+    _age(next(tmp_path.glob("models-*.json")), 120)
+    catalog_server.status = 500
+
+    with OpenRouterClient(
+        base_url=catalog_server.base_url, cache_dir=tmp_path, cache_ttl_seconds=60
+    ) as client:
+        assert client.list_models() == models
+
+    assert len(catalog_server.paths) == 2
+
+
+def test_disk_cache_older_than_max_age_is_ignored(catalog_server, tmp_path):
+    with OpenRouterClient(base_url=catalog_server.base_url, cache_dir=tmp_path) as client:
+        client.list_models()
+    _age(next(tmp_path.glob("models-*.json")), 3600)
+    catalog_server.status = 500
+
+    with OpenRouterClient(
+        base_url=catalog_server.base_url,
+        cache_dir=tmp_path,
+        cache_ttl_seconds=60,
+        disk_cache_max_age_seconds=600,
+    ) as client:
+        with pytest.raises(OpenRouterError):
+            client.list_models()
+
+
+def test_disk_cache_can_be_disabled(catalog_server, tmp_path):
+    with OpenRouterClient(
+        base_url=catalog_server.base_url, cache_dir=tmp_path, use_disk_cache=False
+    ) as client:
+        client.list_models()
+
+    assert _cache_files(tmp_path) == []
+
+
+@pytest.mark.parametrize("use_disk_cache", [True, False])
+def test_unresolvable_home_disables_disk_cache(catalog_server, monkeypatch, use_disk_cache):
+    def no_home(self):
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "expanduser", no_home)
+
+    with OpenRouterClient(
+        base_url=catalog_server.base_url, use_disk_cache=use_disk_cache
+    ) as client:
+        assert [model.id for model in client.list_models()]
+
+    assert catalog_server.paths == ["/api/v1/models"]
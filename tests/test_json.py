@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from mamood_llm_cost_estimator import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(_json, "optional_import", lambda name: None)
+    return request.param
+
+
+@pytest.mark.parametrize("value", [{"input_tokens": 10**20}, {"tokens": -(2**64)}])
+def test_integers_outside_64_bit_range_are_serialized(json_backend, value):
+    assert json.loads(_json.dumps(value)) == value
+    assert json.loads(_json.dumps_indent(value)) == value
+
+
+def test_round_trip(json_backend):
+    payload = {"data": [{"id": "openai/gpt-4o-mini", "pricing": {"prompt": "0.00000015"}}]}
+
+    assert _json.loads(_json.dumps(payload)) == payload